@@ -1,5 +1,6 @@
 """Testing utilities"""
 
+import functools
 import typing
 
 import pydantic
@@ -9,9 +10,13 @@ from hrefs._util import is_pydantic_2
 
 if is_pydantic_2():
 
+    @functools.lru_cache(maxsize=None)
+    def _get_type_adapter(type_: typing.Any):
+        return pydantic.TypeAdapter(type_)
+
     def parse_obj(type_: typing.Type[typing.Any], value: typing.Any):
         """Parse ``value`` as ``type_``"""
-        adapter = pydantic.TypeAdapter(type_)
+        adapter = _get_type_adapter(type_)  # type: ignore
         return adapter.validate_python(value)
 
 else:
@@ -1,13 +1,22 @@
 """Test configurations for the hrefs library"""
 
+import os
 import re
 import typing
 
+from hypothesis import settings
 import pytest
 
 from hrefs.model import HrefResolver, resolve_hrefs
 from hrefs._util import parse_url
 
+settings.register_profile(
+    "ci", max_examples=25, deadline=None, derandomize=True, database=None
+)
+settings.load_profile(
+    os.environ.get("HYPOTHESIS_PROFILE", "ci" if os.environ.get("CI") else "default")
+)
+
 _URL_RE = re.compile(r"\Ahttp://example\.com/[a-z_]+/(-?\d+(/-?\d+)*)\Z")
 
 
@@ -24,13 +24,15 @@ import pytest
 
 from app import app
 
+_client = TestClient(app)
+
 
 class AppStateMachine(RuleBasedStateMachine):
     """Rule based state machine for the test application"""
 
     def __init__(self):
         super().__init__()
-        self.client = TestClient(app)
+        self.client = _client
 
     books: Bundle = Bundle("books")
     libraries: Bundle = Bundle("libraries")
@@ -66,7 +68,7 @@ class AppStateMachine(RuleBasedStateMachine):
             json={
                 "books": [
                     *(book[0] for book in books_by_url),
-                    *(book[0].split("/")[-1] for book in books_by_id),
+                    *(book[0].rsplit("/", 1)[-1] for book in books_by_id),
                 ]
             },
         )
@@ -74,7 +76,10 @@ class AppStateMachine(RuleBasedStateMachine):
         url = response.headers["Location"]
         return url, book_urls
 
-    @rule(books=st.lists(books), nonexistent_books=st.lists(st.uuids(), min_size=1))
+    @rule(
+        books=st.lists(books),
+        nonexistent_books=st.lists(st.uuids(), min_size=1, max_size=5, unique=True),
+    )
     def create_library_with_nonexistent_books(self, books, nonexistent_books):
         """Try to create a library with nonexistent books"""
         response = self.client.post(
@@ -2,6 +2,9 @@
 
 # pylint: disable=duplicate-code
 
+import re
+import typing
+
 from hypothesis import given, strategies as st
 import pytest
 from typing_extensions import Annotated
@@ -12,6 +15,25 @@ from hrefs._util import parse_url, is_pydantic_2
 
 pytestmark = pytest.mark.usefixtures("href_resolver")
 
+_BOOK_URL = "http://example.com/books/{id}".format_map
+_BOOK_COVER_URL = "http://example.com/books/{book_id}/cover".format_map
+_PAGE_URL = "http://example.com/books/{book_id}/pages/{page_number}".format_map
+_BOOKMARK_URL = "http://example.com/books/{page_book_id}/pages/{page_page_number}/bookmark".format_map
+
+_BOOK_URL_RE = re.compile(r"\Ahttp://example\.com/books/(-?[0-9]+)\Z")
+_BOOK_COVER_URL_RE = re.compile(r"\Ahttp://example\.com/books/(-?[0-9]+)/cover\Z")
+_PAGE_URL_RE = re.compile(r"\Ahttp://example\.com/books/(-?[0-9]+)/pages/(-?[0-9]+)\Z")
+_BOOKMARK_URL_RE = re.compile(
+    r"\Ahttp://example\.com/books/(-?[0-9]+)/pages/(-?[0-9]+)/bookmark\Z"
+)
+
+
+def _match_url(pattern: typing.Pattern[str], url: str) -> typing.Tuple[int, ...]:
+    match = pattern.match(url)
+    if not match:
+        raise ValueError(f"Invalid URL {url}")
+    return tuple(int(group) for group in match.groups())
+
 
 class Book(BaseReferrableModel):
     """Model that has `self` primary key"""
@@ -20,12 +42,12 @@ class Book(BaseReferrableModel):
 
     @classmethod
     def _key_to_url_override(cls, key):
-        path_params = cls.key_to_params(key)
-        return f"http://example.com/books/{path_params['id']}"
+        return _BOOK_URL(cls.key_to_params(key))
 
     @classmethod
     def _url_to_key_override(cls, url: str):
-        path_params = {"id": int(url.split("/")[-1])}
+        (book_id,) = _match_url(_BOOK_URL_RE, url)
+        path_params = {"id": book_id}
         key = cls.params_to_key(path_params)
         return key
 
@@ -39,13 +61,12 @@ class BookCover(BaseReferrableModel):
 
     @classmethod
     def _key_to_url_override(cls, key):
-        path_params = cls.key_to_params(key)
-        return f"http://example.com/books/{path_params['book_id']}/cover"
+        return _BOOK_COVER_URL(cls.key_to_params(key))
 
     @classmethod
     def _url_to_key_override(cls, url: str):
-        parts = url.split("/")
-        path_params = {"book_id": int(parts[-2])}
+        (book_id,) = _match_url(_BOOK_COVER_URL_RE, url)
+        path_params = {"book_id": book_id}
         return cls.params_to_key(path_params)
 
 
@@ -60,13 +81,12 @@ class Page(BaseReferrableModel):
 
     @classmethod
     def _key_to_url_override(cls, key):
-        path_params = cls.key_to_params(key)
-        return f"http://example.com/books/{path_params['book_id']}/pages/{path_params['page_number']}"
+        return _PAGE_URL(cls.key_to_params(key))
 
     @classmethod
     def _url_to_key_override(cls, url: str):
-        parts = url.split("/")
-        path_params = {"book_id": int(parts[-3]), "page_number": int(parts[-1])}
+        book_id, page_number = _match_url(_PAGE_URL_RE, url)
+        path_params = {"book_id": book_id, "page_number": page_number}
         return cls.params_to_key(path_params)
 
 
@@ -80,16 +100,12 @@ class Bookmark(BaseReferrableModel):
 
     @classmethod
     def _key_to_url_override(cls, key) -> str:
-        path_params = cls.key_to_params(key)
-        return f"http://example.com/books/{path_params['page_book_id']}/pages/{path_params['page_page_number']}/bookmark"
+        return _BOOKMARK_URL(cls.key_to_params(key))
 
     @classmethod
     def _url_to_key_override(cls, url: str):
-        parts = url.split("/")
-        path_params = {
-            "page_book_id": int(parts[-4]),
-            "page_page_number": int(parts[-2]),
-        }
+        book_id, page_number = _match_url(_BOOKMARK_URL_RE, url)
+        path_params = {"page_book_id": book_id, "page_page_number": page_number}
         return cls.params_to_key(path_params)
 
 
@@ -103,10 +119,11 @@ def test_self_href_from_key(key):
     assert book.self == Href(key=key, url=Book.key_to_url(key))
 
 
-@given(url=st.from_regex(r"\Ahttp://example\.com/books/[0-9]+\Z"))
-def test_self_href_from_url(url):
-    book = Book(self=url)
-    assert book.self == Href(key=Book.url_to_key(url), url=parse_url(url))
+@given(urls=st.lists(st.from_regex(_BOOK_URL_RE), min_size=1, max_size=16))
+def test_self_href_from_url(urls):
+    for url in urls:
+        book = Book(self=url)
+        assert book.self == Href(key=Book.url_to_key(url), url=parse_url(url))
 
 
 @given(book_id=st.from_type(Href[Book]))
@@ -125,7 +142,7 @@ def test_parse_href_key_from_referred_key(book_id):
     assert href.url == BookCover.key_to_url(key)
 
 
-@given(url=st.from_regex(r"\Ahttp://example\.com/books/[0-9]+/cover\Z"))
+@given(url=st.from_regex(_BOOK_COVER_URL_RE))
 def test_parse_href_key_from_referred_url(url):
     href = parse_href(BookCover, url)
     assert href.key == BookCover.url_to_key(url)
@@ -148,11 +165,12 @@ def test_parse_composite_href_key_from_referred_key(book_id, page_number):
     assert href.url == Page.key_to_url(key)
 
 
-@given(url=st.from_regex(r"\Ahttp://example\.com/books/[0-9]+/pages/[0-9]+\Z"))
-def test_parse_composite_href_key_from_referred_url(url):
-    href = parse_href(Page, url)
-    assert href.key == Page.url_to_key(url)
-    assert href.url == parse_url(url)
+@given(urls=st.lists(st.from_regex(_PAGE_URL_RE), min_size=1, max_size=16))
+def test_parse_composite_href_key_from_referred_url(urls):
+    for url in urls:
+        href = parse_href(Page, url)
+        assert href.key == Page.url_to_key(url)
+        assert href.url == parse_url(url)
 
 
 # Only real programmers use model keys that are hrefs to models that also have
@@ -176,11 +194,12 @@ def test_parse_indirect_href_key_from_referred_key(book_id, page_number):
     assert href.url == Bookmark.key_to_url(key)
 
 
-@given(url=st.from_regex(r"\Ahttp://example\.com/books/[0-9]+/pages/[0-9]+/bookmark\Z"))
-def test_parse_indirect_href_key_from_referred_url(url):
-    href = parse_href(Bookmark, url)
-    assert href.key == Bookmark.url_to_key(url)
-    assert href.url == parse_url(url)
+@given(urls=st.lists(st.from_regex(_BOOKMARK_URL_RE), min_size=1, max_size=16))
+def test_parse_indirect_href_key_from_referred_url(urls):
+    for url in urls:
+        href = parse_href(Bookmark, url)
+        assert href.key == Bookmark.url_to_key(url)
+        assert href.url == parse_url(url)
 
 
 def test_hyperlink_with_forward_reference_without_type_fails() -> None:
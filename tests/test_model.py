@@ -28,6 +28,41 @@ if not is_pydantic_2():
     ModelWithForwardReference.update_forward_refs()
 
 
+class SimpleModel(BaseReferrableModel):
+    """Model with the default primary key"""
+
+    id: int
+
+
+class ModelWithPrimaryKeyAnnotation(BaseReferrableModel):
+    """Model whose primary key is annotated"""
+
+    my_id: Annotated[int, PrimaryKey]
+
+
+class Pet(BaseReferrableModel):
+    """Referrable base model"""
+
+    id: int
+
+
+class Cat(Pet):
+    """Model inheriting its primary key"""
+
+    purr_frequency: float
+
+
+class ModelWithHrefToSelf(BaseReferrableModel):
+    """Model containing hyperlink to itself"""
+
+    id: int
+    self: Href["ModelWithHrefToSelf"]
+
+
+if not is_pydantic_2():
+    ModelWithHrefToSelf.update_forward_refs()
+
+
 def test_base_referrable_model_has_empty_key():
     href = parse_href(BaseReferrableModel, BaseReferrableModel())
     assert href.key == ()
@@ -36,26 +71,20 @@ def test_base_referrable_model_has_empty_key():
 
 @given(st.integers())
 def test_simple_model(id) -> None:
-    class _SimpleModel(BaseReferrableModel):
-        id: int
-
-    model = _SimpleModel(id=id)
-    href = parse_href(_SimpleModel, model)
+    model = SimpleModel(id=id)
+    href = parse_href(SimpleModel, model)
     assert href.key == id
-    assert href.url == _SimpleModel.key_to_url(id)
-    assert href == parse_href(_SimpleModel, href.url)
+    assert href.url == SimpleModel.key_to_url(id)
+    assert href == parse_href(SimpleModel, href.url)
 
 
 @given(st.integers())
 def test_primary_key_annotation(my_id) -> None:
-    class _MyModel(BaseReferrableModel):
-        my_id: Annotated[int, PrimaryKey]
-
-    model = _MyModel(my_id=my_id)
-    href = parse_href(_MyModel, model)
+    model = ModelWithPrimaryKeyAnnotation(my_id=my_id)
+    href = parse_href(ModelWithPrimaryKeyAnnotation, model)
     assert href.key == my_id
-    assert href.url == _MyModel.key_to_url(my_id)
-    assert href == parse_href(_MyModel, href.url)
+    assert href.url == ModelWithPrimaryKeyAnnotation.key_to_url(my_id)
+    assert href == parse_href(ModelWithPrimaryKeyAnnotation, href.url)
 
 
 def test_multiple_primary_key_annotations_fails() -> None:
@@ -67,6 +96,15 @@ def test_multiple_primary_key_annotations_fails() -> None:
 
 @given(st.integers())
 def test_href_to_self(id) -> None:
+    model = ModelWithHrefToSelf(id=id, self=id)
+    href = parse_href(ModelWithHrefToSelf, model)
+    assert model.self == href
+    assert href.key == id
+    assert href.url == ModelWithHrefToSelf.key_to_url(id)
+    assert href == parse_href(ModelWithHrefToSelf, href.url)
+
+
+def test_href_to_self_populated_by_validator() -> None:
     validator_decorator = (
         pydantic.model_validator(mode="before")
         if is_pydantic_2()
@@ -85,12 +123,8 @@ def test_href_to_self(id) -> None:
     if not is_pydantic_2():
         _MyModel.update_forward_refs()
 
-    model = _MyModel(id=id)
-    href = parse_href(_MyModel, model)
-    assert model.self == href
-    assert href.key == id
-    assert href.url == _MyModel.key_to_url(id)
-    assert href == parse_href(_MyModel, href.url)
+    model = _MyModel(id=1)
+    assert model.self == parse_href(_MyModel, model)
 
 
 @given(st.integers())
@@ -102,17 +136,11 @@ def test_href_forward_reference(id) -> None:
 
 @given(key=st.integers(), purr_frequency=st.floats())
 def test_derived_model_inherits_referrable_properties(key, purr_frequency) -> None:
-    class _Pet(BaseReferrableModel):
-        id: int
-
-    class _Cat(_Pet):
-        purr_frequency: float
-
-    cat = _Cat(id=key, purr_frequency=purr_frequency)
-    href = parse_href(_Cat, cat)
+    cat = Cat(id=key, purr_frequency=purr_frequency)
+    href = parse_href(Cat, cat)
     assert href.key == key
-    assert href.url == _Cat.key_to_url(key)
-    assert href == parse_href(_Cat, href.url)
+    assert href.url == Cat.key_to_url(key)
+    assert href == parse_href(Cat, href.url)
 
 
 def test_simple_model_has_simple_key() -> None: